@@ -2,9 +2,15 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from main import (
+    find_2024_monthly_columns,
+    find_customer_column,
+    paginate_table,
+    load_revenue_sheet,
     load_and_process_data,
-    create_percentage_pie_chart,
+    create_all_pie_charts,
     create_trend_chart,
+    calculate_quarterly_growth,
+    period_over_period_growth,
     calculate_monthly_data_simple,
     create_simple_mom_chart,
     analyze_individual_customers_q1,
@@ -27,7 +33,11 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+@st.cache_resource
+def inject_custom_css():
+    """Inject the dashboard CSS once; Streamlit replays the cached element on reruns"""
+    
+    st.markdown("""
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -66,6 +76,365 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+inject_custom_css()
+
+
+def get_session_upload(uploaded_file):
+    """Return the parsed upload held in session state, parsing only when a new file arrives"""
+    
+    # file_id is stable for an upload, so reruns skip hashing the file bytes
+    upload = st.session_state.get('upload')
+    if upload is None or upload['file_id'] != uploaded_file.file_id:
+        # The sheet is read without the unnecessary columns, once for every view
+        df_original = load_revenue_sheet(uploaded_file.getvalue())
+        upload = {
+            'file_id': uploaded_file.file_id,
+            'df_original': df_original,
+            'customer_column': find_customer_column(df_original),
+            'monthly_cols': find_2024_monthly_columns(df_original.columns),
+            'quarterly': {}
+        }
+        st.session_state['upload'] = upload
+    
+    return upload
+
+
+@st.fragment
+def render_mrr_values_tab(quarterly_mrr, analysis_type):
+    """Render the quarterly MRR table"""
+    
+    st.subheader(f"Quarterly MRR by {analysis_type}")
+    
+    
+    # Display the data table
+    st.subheader("Detailed MRR Table")
+    st.dataframe(
+        paginate_table(quarterly_mrr, key="mrr_table"),
+        column_config={col: st.column_config.NumberColumn(format="$%,.2f") for col in quarterly_mrr.columns},
+        use_container_width=True
+    )
+
+
+@st.fragment
+def render_percentage_tab(quarterly_percentages, analysis_type):
+    """Render the quarter pie chart and percentage table"""
+    
+    st.subheader(f"Quarterly Percentage Distribution by {analysis_type}")
+    
+    # Quarter selection dropdown
+    quarter_to_view = st.selectbox(
+        "Select Quarter to View",
+        options=quarterly_percentages.columns.tolist(),
+        index=0
+    )
+    
+    # Display the precomputed pie chart for selected quarter
+    pie_charts = create_all_pie_charts(quarterly_percentages, analysis_type)
+    st.plotly_chart(pie_charts[quarter_to_view], use_container_width=True)
+    
+    # Display the percentage table
+    st.subheader("Detailed Percentage Table")
+    st.dataframe(
+        paginate_table(quarterly_percentages, key="percentage_table"),
+        column_config={col: st.column_config.NumberColumn(format="%.2f%%") for col in quarterly_percentages.columns},
+        use_container_width=True
+    )
+
+
+@st.fragment
+def render_trend_tab(quarterly_mrr, analysis_type):
+    """Render the MRR trend chart and quarter-over-quarter growth"""
+    
+    st.subheader("MRR Trend Analysis")
+    
+    # Display the trend chart
+    trend_chart = create_trend_chart(quarterly_mrr, analysis_type)
+    st.plotly_chart(trend_chart, use_container_width=True)
+    
+    # Growth analysis
+    st.subheader("Quarter-over-Quarter Growth Analysis")
+    growth_df = calculate_quarterly_growth(quarterly_mrr)
+    
+    st.dataframe(
+        growth_df,
+        column_config={col: st.column_config.NumberColumn(format="%+.2f%%") for col in growth_df.columns},
+        use_container_width=True
+    )
+
+
+@st.fragment
+def render_mom_tab(monthly_totals):
+    """Render the month-over-month chart and summary table"""
+    
+    st.subheader("Month-over-Month Revenue Analysis")
+    
+    # Calculate monthly data
+    monthly_df = calculate_monthly_data_simple(monthly_totals)
+    
+    # Display the chart
+    mom_chart = create_simple_mom_chart(monthly_df)
+    st.plotly_chart(mom_chart, use_container_width=True)
+    
+    # Display the table
+    st.subheader("Monthly Revenue Summary")
+    
+    # Rename columns for better display
+    display_df = monthly_df.rename(columns={
+        'Total_MRR': 'Total MRR',
+        'MOM_Growth_Pct': 'MOM Growth %'
+    })
+    
+    # Format the numbers at render time with a Styler instead of per-row strings
+    st.dataframe(
+        display_df[['Month', 'Total MRR', 'MOM Growth %']].style.format(
+            {'Total MRR': "${:,.2f}", 'MOM Growth %': "{:+.2f}%"}, na_rep="N/A"
+        ),
+        use_container_width=True,
+        hide_index=True
+    )
+
+
+@st.fragment
+def render_top_customers_tab(df_original, customer_column, monthly_cols):
+    """Render the Q1 individual customer analysis"""
+    
+    st.subheader("Individual Customer Analysis - Q1 2024")
+    
+    try:
+        # Analyze individual customers
+        top_customers_analysis, all_customers, customer_column = analyze_individual_customers_q1(df_original, customer_column, monthly_cols)
+        
+        # Total Q1 revenue across all customers, reused by every share below
+        total_revenue = float(all_customers.sum())
+        
+        st.success(f"Found customer data in column: **{customer_column}**")
+        st.info(f"Analyzing **{len(all_customers)}** individual customers")
+        
+        # Overview metrics
+        st.subheader("Customer Concentration Overview")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            top5_pct = top_customers_analysis[5]['percentage_of_total']
+            top5_revenue = top_customers_analysis[5]['total_revenue']
+            st.metric(
+                "Top 5 Customers", 
+                f"{top5_pct:.1f}%",
+                delta=f"${top5_revenue:,.0f}",
+                help="Percentage and total Q1 revenue from top 5 customers"
+            )
+        
+        with col2:
+            top10_pct = top_customers_analysis[10]['percentage_of_total']
+            top10_revenue = top_customers_analysis[10]['total_revenue']
+            st.metric(
+                "Top 10 Customers", 
+                f"{top10_pct:.1f}%",
+                delta=f"${top10_revenue:,.0f}",
+                help="Percentage and total Q1 revenue from top 10 customers"
+            )
+        
+        with col3:
+            top15_pct = top_customers_analysis[15]['percentage_of_total']
+            top15_revenue = top_customers_analysis[15]['total_revenue']
+            st.metric(
+                "Top 15 Customers", 
+                f"{top15_pct:.1f}%",
+                delta=f"${top15_revenue:,.0f}",
+                help="Percentage and total Q1 revenue from top 15 customers"
+            )
+        
+        # Revenue concentration chart
+        st.subheader("Revenue Concentration Analysis")
+        concentration_chart = create_customer_concentration_chart(top_customers_analysis)
+        st.plotly_chart(concentration_chart, use_container_width=True)
+        
+        # Interactive selection for detailed analysis
+        st.subheader("Individual Customer Detailed Analysis")
+        
+        # Dropdown to select top N customers to analyze
+        selected_top_n = st.selectbox(
+            "Select number of top customers to analyze:",
+            options=[5, 10, 15],
+            index=0,
+            help="Choose how many top individual customers you want to see in detail"
+        )
+        
+        # Display chart for selected top N individual customers
+        st.subheader(f"Top {selected_top_n} Individual Customers - Q1 2024 Revenue")
+        top_customers_chart = create_individual_customers_chart(top_customers_analysis, selected_top_n)
+        st.plotly_chart(top_customers_chart, use_container_width=True)
+        
+        # Display detailed table for individual customers
+        st.subheader(f"Top {selected_top_n} Individual Customers - Detailed Table")
+        
+        selected_customers = top_customers_analysis[selected_top_n]['customers']
+        customer_details = top_customers_analysis[selected_top_n]['customer_details']
+        
+        # Share of total Q1 revenue, scaled to percent in place
+        selected_revenue = selected_customers.to_numpy(dtype=np.float64)
+        share_of_total = selected_revenue / total_revenue
+        share_of_total *= 100
+        
+        # Create detailed dataframe with monthly breakdown, named for display from the start
+        detailed_df = pd.DataFrame({
+            'Rank': np.arange(1, len(selected_customers) + 1, dtype=np.int32),
+            'Customer Name': selected_customers.index,
+            'Q1 Total Revenue': selected_revenue,
+            '% of Total Q1': share_of_total
+        })
+        
+        # Add monthly columns if available
+        monthly_cols = [col for col in customer_details.columns if col != 'Q1_Total']
+        month_columns = []
+        if len(monthly_cols) >= 3:
+            q1_monthly_cols = monthly_cols[:3]
+            month_columns = ['Jan 2024', 'Feb 2024', 'Mar 2024']
+            # One bulk lookup for every selected customer instead of a .loc call per cell
+            monthly_values = customer_details.loc[selected_customers.index, q1_monthly_cols].to_numpy()
+            for i, month_column in enumerate(month_columns):
+                detailed_df[month_column] = monthly_values[:, i]
+        
+        # Format the numbers in the frontend instead of per-row strings
+        detailed_formats = {col: st.column_config.NumberColumn(format="$%,.2f") for col in ['Q1 Total Revenue', *month_columns]}
+        detailed_formats['% of Total Q1'] = st.column_config.NumberColumn(format="%.2f%%")
+        
+        st.dataframe(
+            detailed_df,
+            column_config=detailed_formats,
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        # Individual customer insights
+        st.subheader("Key Customer Insights")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**Top Individual Performers:**")
+            top_3_customers = selected_customers.head(3)
+            for i, (customer, revenue) in enumerate(top_3_customers.items(), 1):
+                percentage = (revenue / total_revenue) * 100
+                st.write(f"{i}. **{customer}**: ${revenue:,.2f} ({percentage:.2f}%)")
+        
+        with col2:
+            # Work on the raw array and compute the mean only once
+            customer_revenue = all_customers.to_numpy()
+            average_revenue = customer_revenue.mean()
+            
+            st.write("**Customer Distribution Stats:**")
+            st.write(f"• **Total Individual Customers**: {customer_revenue.size}")
+            st.write(f"• **Average Q1 Revenue**: ${average_revenue:,.2f}")
+            st.write(f"• **Median Q1 Revenue**: ${np.median(customer_revenue):,.2f}")
+            st.write(f"• **Top Customer Revenue**: ${customer_revenue.max():,.2f}")
+            
+            # Revenue distribution
+            customers_above_avg = np.count_nonzero(customer_revenue > average_revenue)
+            st.write(f"• **Customers Above Average**: {customers_above_avg} ({customers_above_avg/customer_revenue.size*100:.1f}%)")
+    
+    except Exception as e:
+        st.error(f"Error analyzing individual customers: {str(e)}")
+        st.info("Please ensure your data has a customer identifier column (Customer, Client, Company Name, etc.)")
+
+
+@st.fragment
+def render_bridge_preview_tab(df_original, customer_column, monthly_cols_bridge):
+    """Render the Q1 to Q2 revenue bridge preview"""
+    
+    st.subheader("Revenue Bridge Analysis (Q1 to Q2)")
+    
+    st.markdown('<div class="bridge-warning">', unsafe_allow_html=True)
+    st.info("**Quick Access**: For detailed Revenue Bridge analysis, select 'Revenue Bridge' from the analysis type selector at the top of the page.")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    try:
+        if len(monthly_cols_bridge) >= 6 and customer_column:
+            # Calculate revenue bridge
+            bridge_data, customer_analysis, bridge_metrics = calculate_revenue_bridge(df_original, customer_column, monthly_cols_bridge)
+            
+            # Simplified Bridge Metrics
+            st.subheader("Key Bridge Metrics")
+            
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                nrr_value = bridge_data['NRR']
+                st.metric(
+                    "Net Revenue Retention", 
+                    f"{nrr_value:.1%}",
+                    delta=f"{(nrr_value - 1.0):.1%}",
+                    delta_color="normal" if nrr_value >= 1.0 else "inverse"
+                )
+            
+            with col2:
+                grr_value = bridge_data['GRR']
+                st.metric(
+                    "Gross Revenue Retention", 
+                    f"{grr_value:.1%}",
+                    delta=f"{(grr_value - 1.0):.1%}",
+                    delta_color="normal" if grr_value >= 0.9 else "inverse"
+                )
+            
+            with col3:
+                net_change = bridge_data['Net_Change']
+                st.metric(
+                    "Net Revenue Change", 
+                    f"${net_change:,.0f}",
+                    delta=f"{(net_change / bridge_data['Opening_Revenue_Q1']):.1%}",
+                    delta_color="normal" if net_change >= 0 else "inverse"
+                )
+            
+            # Quick Bridge Chart
+            st.subheader("Revenue Bridge Overview")
+            bridge_chart = create_revenue_bridge_chart(bridge_data)
+            st.plotly_chart(bridge_chart, use_container_width=True)
+            
+            # Quick Bridge Summary
+            st.subheader("Bridge Components")
+            
+            bridge_summary = pd.DataFrame({
+                'Component': ['Q1 Opening', 'Churn', 'Expansion', 'Contraction', 'New Customers', 'Q2 Closing'],
+                'Amount': np.array([
+                    bridge_data['Opening_Revenue_Q1'],
+                    bridge_data['Churn'],
+                    bridge_data['Expansion'],
+                    bridge_data['Contraction'],
+                    bridge_data['New_Customers'],
+                    bridge_data['Closing_Revenue_Q2']
+                ], dtype=np.float64),
+                'Impact': [
+                    "Baseline",
+                    f"Lost {bridge_metrics['churned_customers_count']} customers",
+                    f"Growth from {bridge_metrics['expansion_customers_count']} customers",
+                    f"Decline from {bridge_metrics['contraction_customers_count']} customers",
+                    f"Added {bridge_metrics['new_customers_count']} customers",
+                    f"Net change: ${bridge_data['Net_Change']:+,.0f}"
+                ]
+            })
+            
+            # Amounts stay numeric; the table formats them in the frontend
+            st.dataframe(
+                bridge_summary,
+                column_config={'Amount': st.column_config.NumberColumn(format="$%,.0f")},
+                use_container_width=True,
+                hide_index=True
+            )
+        
+        else:
+            if len(monthly_cols_bridge) < 6:
+                st.warning(f"Need at least 6 months of data for Revenue Bridge analysis. Found {len(monthly_cols_bridge)} months.")
+            if not customer_column:
+                st.warning("Need customer identifier column for Revenue Bridge analysis.")
+            
+            st.info("For complete Revenue Bridge analysis, select 'Revenue Bridge' from the main analysis selector above.")
+    
+    except Exception as e:
+        st.error(f"Error in Revenue Bridge preview: {str(e)}")
+        st.info("For detailed Revenue Bridge analysis, please select 'Revenue Bridge' from the analysis type selector at the top.")
+
+
 def main():
     # Main header
     st.markdown('<h1 class="main-header">Unified Quarterly MRR Analysis Dashboard</h1>', unsafe_allow_html=True)
@@ -116,59 +485,16 @@ def main():
     
     if uploaded_file is not None:
         try:
+            # Parse the workbook once per upload and share it with every view below
+            upload = get_session_upload(uploaded_file)
+            df_original = upload['df_original']
+            
             if analysis_type == "Revenue Bridge":
                 # REVENUE BRIDGE ANALYSIS FLOW
                 
-                # Load and process data for Revenue Bridge
-                df_original = pd.read_excel(uploaded_file, sheet_name='Sheet1')
-                
-                # Drop unnecessary columns
-                columns_to_drop = [
-                    "Entity\nUpto Mar 2024", 
-                    "Entity April 2024", 
-                    "Entity grouped",
-                    "S. no."
-                ]
-                df_original = df_original.drop(columns=[col for col in columns_to_drop if col in df_original.columns], errors='ignore')
-                
-                # Find customer column
-                customer_column = None
-                possible_customer_cols = ['Customer', 'Client', 'Customer Name', 'Client Name', 
-                                         'Company', 'Company Name', 'Entity', 'Account']
-                
-                for col in possible_customer_cols:
-                    if col in df_original.columns:
-                        customer_column = col
-                        break
-                
-                if customer_column is None:
-                    for col in df_original.columns:
-                        if df_original[col].dtype == 'object' and col not in ['Country', 'Industry']:
-                            customer_column = col
-                            break
-                
-                # Get monthly columns
-                monthly_cols_bridge = []
-                for col in df_original.columns:
-                    if isinstance(col, pd.Timestamp) and col.year == 2024:
-                        monthly_cols_bridge.append(col)
-                    elif isinstance(col, str) and '2024' in str(col):
-                        try:
-                            parsed_date = pd.to_datetime(col, errors='coerce')
-                            if pd.notna(parsed_date) and parsed_date.year == 2024:
-                                monthly_cols_bridge.append(col)
-                        except:
-                            continue
-                
-                if not monthly_cols_bridge:
-                    for col in df_original.columns:
-                        if '2024' in str(col):
-                            monthly_cols_bridge.append(col)
-                
-                try:
-                    monthly_cols_bridge = sorted(monthly_cols_bridge, key=lambda x: pd.to_datetime(str(x)))
-                except:
-                    monthly_cols_bridge = sorted(monthly_cols_bridge)
+                # The customer column and the 2024 monthly columns are detected once per upload
+                customer_column = upload['customer_column']
+                monthly_cols_bridge = upload['monthly_cols']
                 
                 if len(monthly_cols_bridge) >= 6 and customer_column:
                     # Calculate revenue bridge
@@ -262,31 +588,37 @@ def main():
                     with col2:
                         st.subheader("Bridge Components Summary")
                         
+                        # Assemble the numeric columns as typed arrays; the table formats them in the frontend
+                        amounts = np.array([
+                            bridge_data['Opening_Revenue_Q1'],
+                            bridge_data['Churn'],
+                            bridge_data['Expansion'],
+                            bridge_data['Contraction'],
+                            bridge_data['New_Customers'],
+                            bridge_data['Closing_Revenue_Q2']
+                        ], dtype=np.float64)
+                        customer_counts = np.array([
+                            int(np.count_nonzero(customer_analysis['Q1_Revenue'].to_numpy() > 0)),
+                            bridge_metrics['churned_customers_count'],
+                            bridge_metrics['expansion_customers_count'],
+                            bridge_metrics['contraction_customers_count'],
+                            bridge_metrics['new_customers_count'],
+                            int(np.count_nonzero(customer_analysis['Q2_Revenue'].to_numpy() > 0))
+                        ], dtype=np.int64)
+                        
                         bridge_summary = pd.DataFrame({
                             'Component': ['Opening Revenue (Q1)', 'Churn', 'Expansion', 'Contraction', 'New Customers', 'Closing Revenue (Q2)'],
-                            'Amount': [
-                                bridge_data['Opening_Revenue_Q1'],
-                                bridge_data['Churn'],
-                                bridge_data['Expansion'],
-                                bridge_data['Contraction'],
-                                bridge_data['New_Customers'],
-                                bridge_data['Closing_Revenue_Q2']
-                            ],
-                            'Customer Count': [
-                                len(customer_analysis[customer_analysis['Q1_Revenue'] > 0]),
-                                bridge_metrics['churned_customers_count'],
-                                bridge_metrics['expansion_customers_count'],
-                                bridge_metrics['contraction_customers_count'],
-                                bridge_metrics['new_customers_count'],
-                                len(customer_analysis[customer_analysis['Q2_Revenue'] > 0])
-                            ]
+                            'Amount': amounts,
+                            '% of Q1': amounts / bridge_data['Opening_Revenue_Q1'] * 100,
+                            'Customer Count': customer_counts
                         })
                         
-                        bridge_summary['Amount_Formatted'] = bridge_summary['Amount'].apply(lambda x: f"${x:,.0f}")
-                        bridge_summary['% of Q1'] = (bridge_summary['Amount'] / bridge_data['Opening_Revenue_Q1'] * 100).apply(lambda x: f"{x:.1f}%")
-                        
                         st.dataframe(
-                            bridge_summary[['Component', 'Amount_Formatted', '% of Q1', 'Customer Count']].rename(columns={'Amount_Formatted': 'Amount'}),
+                            bridge_summary,
+                            column_config={
+                                'Amount': st.column_config.NumberColumn(format="$%,.0f"),
+                                '% of Q1': st.column_config.NumberColumn(format="%.1f%%")
+                            },
                             use_container_width=True,
                             hide_index=True
                         )
@@ -297,7 +629,7 @@ def main():
                     # Filter options
                     segment_filter = st.selectbox(
                         "Filter by Customer Segment:",
-                        options=['All Segments'] + list(customer_analysis['Segment'].unique()),
+                        options=['All Segments', *customer_analysis['Segment'].cat.categories],
                         index=0
                     )
                     
@@ -307,28 +639,21 @@ def main():
                     else:
                         filtered_analysis = customer_analysis
                     
-                    # Show top 20 customers by default, all if filtered
-                    display_count = 20 if segment_filter == 'All Segments' else len(filtered_analysis)
-                    filtered_analysis = filtered_analysis.head(display_count)
-                    
-                    # Format customer analysis for display
-                    display_customer_analysis = filtered_analysis.copy()
-                    display_customer_analysis['Q1_Revenue'] = display_customer_analysis['Q1_Revenue'].apply(lambda x: f"${x:,.2f}")
-                    display_customer_analysis['Q2_Revenue'] = display_customer_analysis['Q2_Revenue'].apply(lambda x: f"${x:,.2f}")
-                    display_customer_analysis['Change'] = display_customer_analysis['Change'].apply(lambda x: f"${x:,.2f}")
-                    display_customer_analysis['Change_Pct'] = display_customer_analysis['Change_Pct'].apply(
-                        lambda x: f"{x:+.1f}%" if pd.notna(x) else "N/A"
-                    )
+                    # Show one page of customers at a time
+                    filtered_analysis = paginate_table(filtered_analysis, key="bridge_customers")
                     
-                    # Rename columns for display
-                    display_customer_analysis = display_customer_analysis.rename(columns={
+                    # Rename columns for display; Styler formats the numbers at render time
+                    display_customer_analysis = filtered_analysis.rename(columns={
                         'Q1_Revenue': 'Q1 Revenue',
                         'Q2_Revenue': 'Q2 Revenue',
                         'Change_Pct': 'Change %'
                     })
                     
                     st.dataframe(
-                        display_customer_analysis[['Customer', 'Q1 Revenue', 'Q2 Revenue', 'Change', 'Change %', 'Segment']],
+                        display_customer_analysis[['Customer', 'Q1 Revenue', 'Q2 Revenue', 'Change', 'Change %', 'Segment']].style.format(
+                            {'Q1 Revenue': "${:,.2f}", 'Q2 Revenue': "${:,.2f}", 'Change': "${:,.2f}", 'Change %': "{:+.1f}%"},
+                            na_rep="N/A"
+                        ),
                         use_container_width=True,
                         hide_index=True
                     )
@@ -347,8 +672,11 @@ def main():
                         
                         if len(bridge_metrics['top_contraction_customers']) > 0:
                             st.write("**Highest Contracting Customers:**")
-                            for customer, change in bridge_metrics['top_contraction_customers'].head(3).items():
-                                st.write(f"• {customer}: ${change:,.0f}")
+                            # One markdown block for the three customers, one line each
+                            st.write("  \n".join(
+                                f"• {customer}: ${change:,.0f}"
+                                for customer, change in bridge_metrics['top_contraction_customers'].head(3).items()
+                            ))
                     
                     with col2:
                         st.write("**Growth Drivers:**")
@@ -359,8 +687,11 @@ def main():
                         
                         if len(bridge_metrics['top_expansion_customers']) > 0:
                             st.write("**Top Expanding Customers:**")
-                            for customer, change in bridge_metrics['top_expansion_customers'].head(3).items():
-                                st.write(f"• {customer}: +${change:,.0f}")
+                            # One markdown block for the three customers, one line each
+                            st.write("  \n".join(
+                                f"• {customer}: +${change:,.0f}"
+                                for customer, change in bridge_metrics['top_expansion_customers'].head(3).items()
+                            ))
                 
                 else:
                     # Show error message for insufficient data
@@ -383,38 +714,33 @@ def main():
             else:
                 # EXISTING QUARTERLY MRR ANALYSIS FLOW (Geography/Industry)
                 
-                # Process the data
-                quarterly_mrr, quarterly_percentages, monthly_mrr = load_and_process_data(uploaded_file, analysis_type)
+                # Process the data once per analysis type for this upload; failures are not
+                # kept, so the cached call runs again and replays its error on every rerun
+                quarterly_result = upload['quarterly'].get(analysis_type)
+                if quarterly_result is None:
+                    quarterly_result = load_and_process_data(uploaded_file.getvalue(), analysis_type)
+                    if quarterly_result[0] is not None:
+                        upload['quarterly'][analysis_type] = quarterly_result
+                quarterly_mrr, quarterly_percentages, monthly_totals = quarterly_result
                 
                 if quarterly_mrr is not None and quarterly_percentages is not None:
+                    # Materialize the quarterly arrays once for the summary and insights;
+                    # the DataFrames are kept for display only
+                    mrr_values = quarterly_mrr.to_numpy()
+                    percentage_values = quarterly_percentages.to_numpy()
+                    
                     # Overview metrics
                     st.header("Executive Summary")
                     
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    total_q1 = quarterly_mrr['Q1 2024'].sum()
-                    total_q2 = quarterly_mrr['Q2 2024'].sum()
-                    total_q3 = quarterly_mrr['Q3 2024'].sum()
-                    total_q4 = quarterly_mrr['Q4 2024'].sum()
-                    
-                    with col1:
-                        st.metric("Q1 2024 Total MRR", f"${total_q1:,.2f}", 
-                                 delta=None, delta_color="normal")
-                    
-                    with col2:
-                        delta_q2 = ((total_q2 - total_q1) / total_q1 * 100) if total_q1 != 0 else 0
-                        st.metric("Q2 2024 Total MRR", f"${total_q2:,.2f}", 
-                                 delta=f"{delta_q2:+.2f}%", delta_color="normal")
-                    
-                    with col3:
-                        delta_q3 = ((total_q3 - total_q2) / total_q2 * 100) if total_q2 != 0 else 0
-                        st.metric("Q3 2024 Total MRR", f"${total_q3:,.2f}", 
-                                 delta=f"{delta_q3:+.2f}%", delta_color="normal")
+                    # Quarter totals and Q/Q growth with the same rule as the growth table;
+                    # Q1 has no prior quarter and growth after a zero quarter shows as 0
+                    quarter_totals = mrr_values.sum(axis=0)
+                    quarter_deltas = np.nan_to_num(period_over_period_growth(quarter_totals))
                     
-                    with col4:
-                        delta_q4 = ((total_q4 - total_q3) / total_q3 * 100) if total_q3 != 0 else 0
-                        st.metric("Q4 2024 Total MRR", f"${total_q4:,.2f}", 
-                                 delta=f"{delta_q4:+.2f}%", delta_color="normal")
+                    for i, (col, quarter) in enumerate(zip(st.columns(4), quarterly_mrr.columns)):
+                        with col:
+                            st.metric(f"{quarter} Total MRR", f"${quarter_totals[i]:,.2f}", 
+                                     delta=None if i == 0 else f"{quarter_deltas[i - 1]:+.2f}%", delta_color="normal")
                     
                     # Detailed Analysis
                     st.header(f"{analysis_type} Breakdown")
@@ -430,382 +756,22 @@ def main():
                     ])
                     
                     with tab1:
-                        st.subheader(f"Quarterly MRR by {analysis_type}")
-                        
-                        
-                        # Display the data table
-                        st.subheader("Detailed MRR Table")
-                        st.dataframe(
-                            quarterly_mrr.style.format("${:,.2f}"),
-                            use_container_width=True
-                        )
+                        render_mrr_values_tab(quarterly_mrr, analysis_type)
                     
                     with tab2:
-                        st.subheader(f"Quarterly Percentage Distribution by {analysis_type}")
-                        
-                        # Quarter selection dropdown
-                        quarter_to_view = st.selectbox(
-                            "Select Quarter to View",
-                            options=quarterly_percentages.columns.tolist(),
-                            index=0
-                        )
-                        
-                        # Display the pie chart for selected quarter
-                        pie_chart = create_percentage_pie_chart(quarterly_percentages, quarter_to_view, analysis_type)
-                        st.plotly_chart(pie_chart, use_container_width=True)
-                        
-                        # Display the percentage table
-                        st.subheader("Detailed Percentage Table")
-                        st.dataframe(
-                            quarterly_percentages.style.format("{:.2f}%"),
-                            use_container_width=True
-                        )
+                        render_percentage_tab(quarterly_percentages, analysis_type)
                     
                     with tab3:
-                        st.subheader("MRR Trend Analysis")
-                        
-                        # Display the trend chart
-                        trend_chart = create_trend_chart(quarterly_mrr, analysis_type)
-                        st.plotly_chart(trend_chart, use_container_width=True)
-                        
-                        # Growth analysis
-                        st.subheader("Quarter-over-Quarter Growth Analysis")
-                        growth_df = quarterly_mrr.pct_change(axis=1) * 100
-                        growth_df = growth_df.iloc[:, 1:]  # Remove Q1 as it has no previous quarter
-                        growth_df = growth_df.round(2)
-                        
-                        st.dataframe(
-                            growth_df.style.format("{:+.2f}%"),
-                            use_container_width=True
-                        )
-
+                        render_trend_tab(quarterly_mrr, analysis_type)
+                    
                     with tab4:
-                        st.subheader("Month-over-Month Revenue Analysis")
-                        
-                        # Calculate monthly data
-                        monthly_df = calculate_monthly_data_simple(monthly_mrr)
-                        
-                        # Display the chart
-                        mom_chart = create_simple_mom_chart(monthly_df)
-                        st.plotly_chart(mom_chart, use_container_width=True)
-                        
-                        # Display the table
-                        st.subheader("Monthly Revenue Summary")
-                        
-                        # Format the dataframe for display
-                        display_df = monthly_df.copy()
-                        display_df['Total_MRR'] = display_df['Total_MRR'].apply(lambda x: f"${x:,.2f}")
-                        display_df['MOM_Growth_Pct'] = display_df['MOM_Growth_Pct'].apply(
-                            lambda x: f"{x:+.2f}%" if pd.notna(x) else "N/A"
-                        )
-                        
-                        # Rename columns for better display
-                        display_df = display_df.rename(columns={
-                            'Total_MRR': 'Total MRR',
-                            'MOM_Growth_Pct': 'MOM Growth %'
-                        })
-                        
-                        st.dataframe(
-                            display_df[['Month', 'Total MRR', 'MOM Growth %']],
-                            use_container_width=True,
-                            hide_index=True
-                        )
-
+                        render_mom_tab(monthly_totals)
+                    
                     with tab5:
-                        st.subheader("Individual Customer Analysis - Q1 2024")
-                        
-                        try:
-                            # Load original dataframe for individual customer analysis
-                            df_original = pd.read_excel(uploaded_file, sheet_name='Sheet1')
-                            
-                            # Drop unnecessary columns
-                            columns_to_drop = [
-                                "Entity\nUpto Mar 2024", 
-                                "Entity April 2024", 
-                                "Entity grouped",
-                                "S. no."
-                            ]
-                            df_original = df_original.drop(columns=[col for col in columns_to_drop if col in df_original.columns], errors='ignore')
-                            
-                            # Analyze individual customers
-                            top_customers_analysis, all_customers_sorted, customer_column = analyze_individual_customers_q1(df_original)
-                            
-                            st.success(f"Found customer data in column: **{customer_column}**")
-                            st.info(f"Analyzing **{len(all_customers_sorted)}** individual customers")
-                            
-                            # Overview metrics
-                            st.subheader("Customer Concentration Overview")
-                            
-                            col1, col2, col3 = st.columns(3)
-                            
-                            with col1:
-                                top5_pct = top_customers_analysis[5]['percentage_of_total']
-                                top5_revenue = top_customers_analysis[5]['total_revenue']
-                                st.metric(
-                                    "Top 5 Customers", 
-                                    f"{top5_pct:.1f}%",
-                                    delta=f"${top5_revenue:,.0f}",
-                                    help="Percentage and total Q1 revenue from top 5 customers"
-                                )
-                            
-                            with col2:
-                                top10_pct = top_customers_analysis[10]['percentage_of_total']
-                                top10_revenue = top_customers_analysis[10]['total_revenue']
-                                st.metric(
-                                    "Top 10 Customers", 
-                                    f"{top10_pct:.1f}%",
-                                    delta=f"${top10_revenue:,.0f}",
-                                    help="Percentage and total Q1 revenue from top 10 customers"
-                                )
-                            
-                            with col3:
-                                top15_pct = top_customers_analysis[15]['percentage_of_total']
-                                top15_revenue = top_customers_analysis[15]['total_revenue']
-                                st.metric(
-                                    "Top 15 Customers", 
-                                    f"{top15_pct:.1f}%",
-                                    delta=f"${top15_revenue:,.0f}",
-                                    help="Percentage and total Q1 revenue from top 15 customers"
-                                )
-                            
-                            # Revenue concentration chart
-                            st.subheader("Revenue Concentration Analysis")
-                            concentration_chart = create_customer_concentration_chart(top_customers_analysis)
-                            st.plotly_chart(concentration_chart, use_container_width=True)
-                            
-                            # Interactive selection for detailed analysis
-                            st.subheader("Individual Customer Detailed Analysis")
-                            
-                            # Dropdown to select top N customers to analyze
-                            selected_top_n = st.selectbox(
-                                "Select number of top customers to analyze:",
-                                options=[5, 10, 15],
-                                index=0,
-                                help="Choose how many top individual customers you want to see in detail"
-                            )
-                            
-                            # Display chart for selected top N individual customers
-                            st.subheader(f"Top {selected_top_n} Individual Customers - Q1 2024 Revenue")
-                            top_customers_chart = create_individual_customers_chart(top_customers_analysis, selected_top_n)
-                            st.plotly_chart(top_customers_chart, use_container_width=True)
-                            
-                            # Display detailed table for individual customers
-                            st.subheader(f"Top {selected_top_n} Individual Customers - Detailed Table")
-                            
-                            selected_customers = top_customers_analysis[selected_top_n]['customers']
-                            customer_details = top_customers_analysis[selected_top_n]['customer_details']
-                            
-                            # Create detailed dataframe with monthly breakdown
-                            detailed_df = pd.DataFrame({
-                                'Rank': range(1, len(selected_customers) + 1),
-                                'Customer_Name': selected_customers.index,
-                                'Q1_Total_Revenue': selected_customers.values,
-                                'Percentage_of_Total': (selected_customers.values / all_customers_sorted.sum()) * 100
-                            })
-                            
-                            # Add monthly columns if available
-                            monthly_cols = [col for col in customer_details.columns if col != 'Q1_Total']
-                            if len(monthly_cols) >= 3:
-                                q1_monthly_cols = monthly_cols[:3]
-                                for i, month_col in enumerate(q1_monthly_cols, 1):
-                                    detailed_df[f'Month_{i}'] = [customer_details.loc[customer, month_col] for customer in selected_customers.index]
-                            
-                            # Format for display
-                            display_detailed_df = detailed_df.copy()
-                            display_detailed_df['Q1_Total_Revenue'] = display_detailed_df['Q1_Total_Revenue'].apply(lambda x: f"${x:,.2f}")
-                            display_detailed_df['Percentage_of_Total'] = display_detailed_df['Percentage_of_Total'].apply(lambda x: f"{x:.2f}%")
-                            
-                            # Format monthly columns if they exist
-                            month_columns = [col for col in display_detailed_df.columns if col.startswith('Month_')]
-                            for col in month_columns:
-                                display_detailed_df[col] = display_detailed_df[col].apply(lambda x: f"${x:,.2f}")
-                            
-                            # Rename columns for better display
-                            column_renames = {
-                                'Customer_Name': 'Customer Name',
-                                'Q1_Total_Revenue': 'Q1 Total Revenue',
-                                'Percentage_of_Total': '% of Total Q1'
-                            }
-                            
-                            # Add month names if available
-                            if len(month_columns) >= 3:
-                                column_renames.update({
-                                    'Month_1': 'Jan 2024',
-                                    'Month_2': 'Feb 2024', 
-                                    'Month_3': 'Mar 2024'
-                                })
-                            
-                            display_detailed_df = display_detailed_df.rename(columns=column_renames)
-                            
-                            st.dataframe(
-                                display_detailed_df,
-                                use_container_width=True,
-                                hide_index=True
-                            )
-                            
-                            # Individual customer insights
-                            st.subheader("Key Customer Insights")
-                            
-                            col1, col2 = st.columns(2)
-                            
-                            with col1:
-                                st.write("**Top Individual Performers:**")
-                                top_3_customers = selected_customers.head(3)
-                                for i, (customer, revenue) in enumerate(top_3_customers.items(), 1):
-                                    percentage = (revenue / all_customers_sorted.sum()) * 100
-                                    st.write(f"{i}. **{customer}**: ${revenue:,.2f} ({percentage:.2f}%)")
-                            
-                            with col2:
-                                st.write("**Customer Distribution Stats:**")
-                                st.write(f"• **Total Individual Customers**: {len(all_customers_sorted)}")
-                                st.write(f"• **Average Q1 Revenue**: ${all_customers_sorted.mean():,.2f}")
-                                st.write(f"• **Median Q1 Revenue**: ${all_customers_sorted.median():,.2f}")
-                                st.write(f"• **Top Customer Revenue**: ${all_customers_sorted.iloc[0]:,.2f}")
-                                
-                                # Revenue distribution
-                                customers_above_avg = (all_customers_sorted > all_customers_sorted.mean()).sum()
-                                st.write(f"• **Customers Above Average**: {customers_above_avg} ({customers_above_avg/len(all_customers_sorted)*100:.1f}%)")
-                            
-                        except Exception as e:
-                            st.error(f"Error analyzing individual customers: {str(e)}")
-                            st.info("Please ensure your data has a customer identifier column (Customer, Client, Company Name, etc.)")
-
+                        render_top_customers_tab(df_original, upload['customer_column'], upload['monthly_cols'])
+                    
                     with tab6:
-                        st.subheader("Revenue Bridge Analysis (Q1 to Q2)")
-                        
-                        st.markdown('<div class="bridge-warning">', unsafe_allow_html=True)
-                        st.info("**Quick Access**: For detailed Revenue Bridge analysis, select 'Revenue Bridge' from the analysis type selector at the top of the page.")
-                        st.markdown('</div>', unsafe_allow_html=True)
-                        
-                        try:
-                            # Load original dataframe for revenue bridge analysis
-                            df_original = pd.read_excel(uploaded_file, sheet_name='Sheet1')
-                            
-                            # Drop unnecessary columns
-                            columns_to_drop = [
-                                "Entity\nUpto Mar 2024", 
-                                "Entity April 2024", 
-                                "Entity grouped",
-                                "S. no."
-                            ]
-                            df_original = df_original.drop(columns=[col for col in columns_to_drop if col in df_original.columns], errors='ignore')
-                            
-                            # Find customer column
-                            customer_column = None
-                            possible_customer_cols = ['Customer', 'Client', 'Customer Name', 'Client Name', 
-                                                     'Company', 'Company Name', 'Entity', 'Account']
-                            
-                            for col in possible_customer_cols:
-                                if col in df_original.columns:
-                                    customer_column = col
-                                    break
-                            
-                            if customer_column is None:
-                                for col in df_original.columns:
-                                    if df_original[col].dtype == 'object' and col not in ['Country', 'Industry']:
-                                        customer_column = col
-                                        break
-                            
-                            # Get monthly columns
-                            monthly_cols_bridge = []
-                            for col in df_original.columns:
-                                if isinstance(col, pd.Timestamp) and col.year == 2024:
-                                    monthly_cols_bridge.append(col)
-                                elif isinstance(col, str) and '2024' in str(col):
-                                    try:
-                                        parsed_date = pd.to_datetime(col, errors='coerce')
-                                        if pd.notna(parsed_date) and parsed_date.year == 2024:
-                                            monthly_cols_bridge.append(col)
-                                    except:
-                                        continue
-                            
-                            if not monthly_cols_bridge:
-                                for col in df_original.columns:
-                                    if '2024' in str(col):
-                                        monthly_cols_bridge.append(col)
-                            
-                            try:
-                                monthly_cols_bridge = sorted(monthly_cols_bridge, key=lambda x: pd.to_datetime(str(x)))
-                            except:
-                                monthly_cols_bridge = sorted(monthly_cols_bridge)
-                            
-                            if len(monthly_cols_bridge) >= 6 and customer_column:
-                                # Calculate revenue bridge
-                                bridge_data, customer_analysis, bridge_metrics = calculate_revenue_bridge(df_original, customer_column, monthly_cols_bridge)
-                                
-                                # Simplified Bridge Metrics
-                                st.subheader("Key Bridge Metrics")
-                                
-                                col1, col2, col3 = st.columns(3)
-                                
-                                with col1:
-                                    nrr_value = bridge_data['NRR']
-                                    st.metric(
-                                        "Net Revenue Retention", 
-                                        f"{nrr_value:.1%}",
-                                        delta=f"{(nrr_value - 1.0):.1%}",
-                                        delta_color="normal" if nrr_value >= 1.0 else "inverse"
-                                    )
-                                
-                                with col2:
-                                    grr_value = bridge_data['GRR']
-                                    st.metric(
-                                        "Gross Revenue Retention", 
-                                        f"{grr_value:.1%}",
-                                        delta=f"{(grr_value - 1.0):.1%}",
-                                        delta_color="normal" if grr_value >= 0.9 else "inverse"
-                                    )
-                                
-                                with col3:
-                                    net_change = bridge_data['Net_Change']
-                                    st.metric(
-                                        "Net Revenue Change", 
-                                        f"${net_change:,.0f}",
-                                        delta=f"{(net_change / bridge_data['Opening_Revenue_Q1']):.1%}",
-                                        delta_color="normal" if net_change >= 0 else "inverse"
-                                    )
-                                
-                                # Quick Bridge Chart
-                                st.subheader("Revenue Bridge Overview")
-                                bridge_chart = create_revenue_bridge_chart(bridge_data)
-                                st.plotly_chart(bridge_chart, use_container_width=True)
-                                
-                                # Quick Bridge Summary
-                                st.subheader("Bridge Components")
-                                
-                                bridge_summary = pd.DataFrame({
-                                    'Component': ['Q1 Opening', 'Churn', 'Expansion', 'Contraction', 'New Customers', 'Q2 Closing'],
-                                    'Amount': [
-                                        f"${bridge_data['Opening_Revenue_Q1']:,.0f}",
-                                        f"${bridge_data['Churn']:,.0f}",
-                                        f"${bridge_data['Expansion']:,.0f}",
-                                        f"${bridge_data['Contraction']:,.0f}",
-                                        f"${bridge_data['New_Customers']:,.0f}",
-                                        f"${bridge_data['Closing_Revenue_Q2']:,.0f}"
-                                    ],
-                                    'Impact': [
-                                        "Baseline",
-                                        f"Lost {bridge_metrics['churned_customers_count']} customers",
-                                        f"Growth from {bridge_metrics['expansion_customers_count']} customers",
-                                        f"Decline from {bridge_metrics['contraction_customers_count']} customers",
-                                        f"Added {bridge_metrics['new_customers_count']} customers",
-                                        f"Net change: ${bridge_data['Net_Change']:+,.0f}"
-                                    ]
-                                })
-                                
-                                st.dataframe(bridge_summary, use_container_width=True, hide_index=True)
-                                
-                            else:
-                                if len(monthly_cols_bridge) < 6:
-                                    st.warning(f"Need at least 6 months of data for Revenue Bridge analysis. Found {len(monthly_cols_bridge)} months.")
-                                if not customer_column:
-                                    st.warning("Need customer identifier column for Revenue Bridge analysis.")
-                                
-                                st.info("For complete Revenue Bridge analysis, select 'Revenue Bridge' from the main analysis selector above.")
-                                
-                        except Exception as e:
-                            st.error(f"Error in Revenue Bridge preview: {str(e)}")
-                            st.info("For detailed Revenue Bridge analysis, please select 'Revenue Bridge' from the analysis type selector at the top.")
+                        render_bridge_preview_tab(df_original, upload['customer_column'], upload['monthly_cols'])
                     
                     # Key insights
                     st.header("Key Insights")
@@ -815,19 +781,32 @@ def main():
                     
                     with col1:
                         st.subheader(f"Top {analysis_type} by Quarter")
-                        top_performer_by_quarter = quarterly_mrr.idxmax()
-                        for quarter, performer in top_performer_by_quarter.items():
-                            value = quarterly_mrr.loc[performer, quarter]
-                            percentage = quarterly_percentages.loc[performer, quarter]
-                            st.write(f"**{quarter}**: {performer} - ${value:,.2f} ({percentage:.2f}%)")
+                        # Pick each quarter's top row once and gather its MRR and share
+                        # from the same positions
+                        top_rows = mrr_values.argmax(axis=0)
+                        quarter_positions = np.arange(mrr_values.shape[1])
+                        top_performers = pd.DataFrame({
+                            analysis_type: quarterly_mrr.index[top_rows],
+                            'MRR': mrr_values[top_rows, quarter_positions],
+                            'Share %': percentage_values[top_rows, quarter_positions]
+                        }, index=quarterly_mrr.columns).rename_axis('Quarter')
+                        st.dataframe(
+                            top_performers.style.format({'MRR': "${:,.2f}", 'Share %': "{:.2f}%"}),
+                            use_container_width=True
+                        )
                     
                     with col2:
                         st.subheader("Overall Performance")
-                        total_by_dimension = quarterly_mrr.sum(axis=1).sort_values(ascending=False)
+                        total_by_dimension = pd.Series(mrr_values.sum(axis=1), index=quarterly_mrr.index).sort_values(ascending=False)
                         st.write(f"**Total MRR by {analysis_type} (2024):**")
-                        for dimension, value in total_by_dimension.items():
-                            percentage = (value / total_by_dimension.sum()) * 100
-                            st.write(f"• {dimension}: ${value:,.2f} ({percentage:.2f}%)")
+                        overall_performance = pd.DataFrame({
+                            'MRR': total_by_dimension,
+                            'Share %': total_by_dimension / total_by_dimension.sum() * 100
+                        })
+                        st.dataframe(
+                            overall_performance.style.format({'MRR': "${:,.2f}", 'Share %': "{:.2f}%"}),
+                            use_container_width=True
+                        )
                             
         except Exception as e:
             st.error(f"Error processing the file: {str(e)}")
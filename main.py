@@ -1,28 +1,234 @@
+import io
+import re
+from datetime import datetime
+
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
 import numpy as np
-from plotly.subplots import make_subplots
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
-@st.cache_data
-def load_and_process_data(file_path, analysis_type):
-    """Load and process the revenue data for quarterly analysis"""
+# Bookkeeping columns that are never part of the MRR analysis
+COLUMNS_TO_DROP = frozenset({
+    "Entity\nUpto Mar 2024", 
+    "Entity April 2024", 
+    "Entity grouped",
+    "S. no."
+})
+
+# Quarter labels of the quarterly views, in order
+QUARTERS = ['Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024']
+
+# Page sizes offered for paginated tables
+TABLE_PAGE_SIZES = [50, 200, 1000]
+
+# Text month headers such as "2024-01-01 00:00:00", "2024/01", "01/31/2024" or "31/01/2024";
+# the leading digits must start a word, so labels like "Q1-2024" or "H1-2024" are not months
+MONTH_2024_PATTERN = re.compile(r'2024[-/](\d{1,2})(?!\d)|(?<!\w)(\d{1,2})[-/](?:(\d{1,2})[-/])?2024')
+
+
+def month_of_2024_column(col):
+    """Return the month number of a 2024 monthly column header, or None"""
+    
+    # Excel readers return datetime headers (pd.Timestamp is a datetime subclass)
+    if isinstance(col, datetime):
+        return col.month if col.year == 2024 else None
+    
+    if isinstance(col, str):
+        for match in MONTH_2024_PATTERN.finditer(col):
+            year_first, leading, middle = match.groups()
+            if year_first is not None:
+                month = int(year_first)
+            elif int(leading) > 12 and middle is not None:
+                # Day-first dates such as "31/01/2024" carry the month in the middle
+                month = int(middle)
+            else:
+                month = int(leading)
+            
+            # Fiscal-year labels such as "FY2024-25" are not months
+            if 1 <= month <= 12:
+                return month
+    
+    return None
+
+
+def find_2024_monthly_columns(columns):
+    """Return the 2024 monthly columns in chronological order"""
     
-    # Load the Excel file
-    df = pd.read_excel(file_path, sheet_name='Sheet1')
+    # One pass over the headers; each header is classified exactly once
+    column_months = {col: month_of_2024_column(col) for col in columns}
+    monthly_cols = [col for col, month in column_months.items() if month is not None]
     
-    # Drop unnecessary columns upfront
-    columns_to_drop = [
-        "Entity\nUpto Mar 2024", 
-        "Entity April 2024", 
-        "Entity grouped",
-        "S. no."
-    ]
+    # Real datetime headers win; text headers are only a fallback for sheets without them
+    datetime_cols = [col for col in monthly_cols if isinstance(col, datetime)]
+    if datetime_cols:
+        monthly_cols = datetime_cols
     
-    # Drop columns if they exist
-    df = df.drop(columns=[col for col in columns_to_drop if col in df.columns], errors='ignore')
+    return sorted(monthly_cols, key=column_months.get)
+
+
+def find_named_customer_column(columns):
+    """Return the first header that names a customer identifier column, or None"""
+    
+    possible_customer_cols = ['Customer', 'Client', 'Customer Name', 'Client Name', 
+                              'Company', 'Company Name', 'Entity', 'Account', 
+                              'Customer_Name', 'Client_Name']
+    
+    # Tested against a set of the headers
+    header_set = set(columns)
+    return next((col for col in possible_customer_cols if col in header_set), None)
+
+
+def find_customer_column(df):
+    """Return the column that identifies customers for the customer views, or None"""
+    
+    # Named candidates first
+    customer_column = find_named_customer_column(df.columns)
+    if customer_column is not None:
+        return customer_column
+    
+    # Otherwise the first text column that is not a grouping dimension
+    text_columns = df.select_dtypes(include=['object', 'string']).columns
+    text_columns = [col for col in text_columns if col not in ['Country', 'Industry', 'Geography']]
+    return text_columns[0] if text_columns else None
+
+
+def paginate_table(table, key):
+    """Return the page of a long table picked with the rows-per-page and page controls"""
+    
+    # Only the visible page is formatted and sent to the browser
+    if len(table) <= TABLE_PAGE_SIZES[0]:
+        return table
+    
+    size_col, page_col = st.columns(2)
+    page_size = size_col.selectbox("Rows per page", TABLE_PAGE_SIZES, key=f"{key}_page_size")
+    page_count = -(-len(table) // page_size)
+    page = page_col.number_input(f"Page (of {page_count})", min_value=1, value=1, step=1, key=f"{key}_page")
+    
+    # Clamp the page when a larger page size leaves fewer pages
+    start = (min(page, page_count) - 1) * page_size
+    return table.iloc[start:start + page_size]
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def sum_quarters(monthly_values):
+        """Sum a (groups, 12) month matrix into (groups, 4) quarters, one group per thread"""
+        
+        quarterly_values = np.zeros((monthly_values.shape[0], 4))
+        for g in prange(monthly_values.shape[0]):
+            for q in range(4):
+                quarterly_values[g, q] = (monthly_values[g, 3 * q] + monthly_values[g, 3 * q + 1]
+                                          + monthly_values[g, 3 * q + 2])
+        return quarterly_values
+else:
+    def sum_quarters(monthly_values):
+        """Sum a (groups, 12) month matrix into (groups, 4) quarters"""
+        
+        # Reshape to (groups, 4 quarters, 3 months) so one sum covers every quarter
+        return monthly_values.reshape(-1, 4, 3).sum(axis=2)
+
+
+# Segment labels in code order; codes 0-3 are the bridge components, 4 is Stable
+BRIDGE_SEGMENTS = np.array(['Churned', 'New Customer', 'Expansion', 'Contraction', 'Stable'])
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def summarize_bridge(q1_values, q2_values):
+        """Segment every customer and total the bridge components in one fused pass"""
+        
+        segment_codes = np.empty(q1_values.shape[0], dtype=np.int8)
+        churn = 0.0
+        new_customers = 0.0
+        expansion = 0.0
+        contraction = 0.0
+        churn_count = 0
+        new_count = 0
+        expansion_count = 0
+        contraction_count = 0
+        for i in prange(q1_values.shape[0]):
+            q1 = q1_values[i]
+            q2 = q2_values[i]
+            if q1 > 0 and q2 == 0:
+                segment_codes[i] = 0
+                churn += q1
+                churn_count += 1
+            elif q1 == 0 and q2 > 0:
+                segment_codes[i] = 1
+                new_customers += q2
+                new_count += 1
+            elif q2 > q1 and q1 > 0:
+                segment_codes[i] = 2
+                expansion += q2 - q1
+                expansion_count += 1
+            elif q2 < q1 and q2 > 0:
+                segment_codes[i] = 3
+                contraction += q2 - q1
+                contraction_count += 1
+            else:
+                segment_codes[i] = 4
+        component_sums = np.array([-churn, new_customers, expansion, contraction])
+        component_counts = np.array([churn_count, new_count, expansion_count, contraction_count])
+        return segment_codes, component_sums, component_counts
+else:
+    def summarize_bridge(q1_values, q2_values):
+        """Segment every customer and total the bridge components"""
+        
+        # The first matching condition wins, as in an if/elif chain
+        change_values = q2_values - q1_values
+        segment_codes = np.select(
+            [(q1_values > 0) & (q2_values == 0), (q1_values == 0) & (q2_values > 0),
+             (change_values > 0) & (q1_values > 0), (change_values < 0) & (q2_values > 0)],
+            [0, 1, 2, 3], default=4
+        ).astype(np.int8)
+        
+        # Churned rows have Q2 == 0 and new rows Q1 == 0, so the change column
+        # carries -Q1 and Q2 for them respectively
+        component_sums = np.bincount(segment_codes, weights=change_values, minlength=5)[:4]
+        component_counts = np.bincount(segment_codes, minlength=5)[:4]
+        return segment_codes, component_sums, component_counts
+
+
+def read_revenue_sheet(file_path, **read_options):
+    """Read Sheet1 of the revenue workbook with the fastest available Excel engine"""
+    
+    try:
+        # calamine is a Rust-backed streaming reader and keeps datetime headers intact
+        return pd.read_excel(file_path, sheet_name='Sheet1', engine='calamine', **read_options)
+    except ImportError:
+        # Fall back to openpyxl if python-calamine is not installed
+        return pd.read_excel(file_path, sheet_name='Sheet1', engine='openpyxl', **read_options)
+
+
+@st.cache_data(show_spinner=False, persist="disk", max_entries=16)
+def load_revenue_sheet(file_bytes):
+    """Parse the uploaded workbook once per unique upload, keyed by its bytes"""
+    
+    # The bookkeeping columns are skipped while parsing, so they are never materialized;
+    # the parsed sheet is persisted to disk so a restart skips the Excel parse.
+    # Note the disk cache holds the uploaded customer revenue data as pickles under
+    # ~/.streamlit/cache; max_entries only bounds the in-memory copies, and the files
+    # stay until `streamlit cache clear` is run
+    return read_revenue_sheet(io.BytesIO(file_bytes), usecols=lambda col: col not in COLUMNS_TO_DROP)
+
+
+@st.cache_data(persist="disk", max_entries=32)
+def load_and_process_data(file_bytes, analysis_type):
+    """Load and process the revenue data for quarterly analysis"""
+    
+    # Results are persisted to disk per (upload, analysis type), so a restarted
+    # process serves a known workbook without re-running the pipeline. Like the
+    # parsed sheet, these are customer revenue aggregates stored under ~/.streamlit/cache
+    
+    # Load the Excel file from the uploaded bytes, which double as the cache key
+    # (the unnecessary columns are already skipped by the reader)
+    df = load_revenue_sheet(file_bytes)
     
     # Debug: Show remaining columns
     #st.write("**Remaining columns after cleanup:**", len(df.columns))
@@ -41,49 +247,8 @@ def load_and_process_data(file_path, analysis_type):
             st.error(f"Industry column '{grouping_col}' not found!")
             return None, None, None
     
-    # IMPROVED: Multiple methods to detect datetime columns for 2024
-    monthly_cols = []
-    
-    # Method 1: Check for pandas Timestamp objects
-    for col in df.columns:
-        if isinstance(col, pd.Timestamp) and col.year == 2024:
-            monthly_cols.append(col)
-    
-    # Method 2: If no Timestamp objects found, try parsing string columns
-    if not monthly_cols:
-        for col in df.columns:
-            if isinstance(col, str):
-                # Check if it looks like a date string
-                if '2024' in str(col) and ('-' in str(col) or '/' in str(col)):
-                    try:
-                        parsed_date = pd.to_datetime(col, errors='coerce')
-                        if pd.notna(parsed_date) and parsed_date.year == 2024:
-                            monthly_cols.append(col)
-                    except:
-                        continue
-    
-    # Method 3: If still no columns found, look for datetime-like strings
-    if not monthly_cols:
-        for col in df.columns:
-            col_str = str(col)
-            # Look for datetime pattern like "2024-01-01 00:00:00"
-            if '2024-' in col_str and '00:00:00' in col_str:
-                monthly_cols.append(col)
-    
-    # Method 4: Last resort - look for any column containing "2024"
-    if not monthly_cols:
-        for col in df.columns:
-            if '2024' in str(col):
-                monthly_cols.append(col)
-    
-    # Sort monthly columns chronologically
-    if monthly_cols:
-        try:
-            # Try to sort by converting to datetime
-            monthly_cols = sorted(monthly_cols, key=lambda x: pd.to_datetime(str(x)))
-        except:
-            # If that fails, sort as strings
-            monthly_cols = sorted(monthly_cols)
+    # Detect 2024 monthly columns in a single pass over the headers
+    monthly_cols = find_2024_monthly_columns(df.columns)
     
     #st.write(f"**Found {len(monthly_cols)} monthly columns**")
     #if monthly_cols:
@@ -96,39 +261,33 @@ def load_and_process_data(file_path, analysis_type):
             #st.write(f"{i}: {col} (type: {type(col)})")
         #return None, None, None
     
-    # Prepare clean dataframe
-    mrr_df = df[[grouping_col] + monthly_cols].copy()
+    # Convert monthly columns to numeric in one pass; apply builds a new block, so the
+    # selection is not copied first, and float64 keeps the totals exact to the cent
+    mrr_values = df[monthly_cols].apply(pd.to_numeric, errors='coerce').fillna(0).astype(np.float64)
     
-    # Convert monthly columns to numeric, handling any data type issues
-    for col in monthly_cols:
-        mrr_df[col] = pd.to_numeric(mrr_df[col], errors='coerce').fillna(0)
+    # Group by the selected column and sum monthly MRR; categorical keys let the
+    # groupby hash integer codes instead of Python strings, and going through an
+    # Arrow string column builds those codes with Arrow's hash kernel
+    group_keys = df[grouping_col].astype('string[pyarrow]').astype('category')
     
-    # Remove rows where grouping column is null or empty
-    mrr_df = mrr_df.dropna(subset=[grouping_col])
-    mrr_df = mrr_df[mrr_df[grouping_col].astype(str).str.strip() != '']
-    
-    # Group by the selected column and sum monthly MRR
-    mrr_grouped = mrr_df.groupby(grouping_col).sum()
+    # Blank labels are found among the unique categories only; removing them turns
+    # those rows into NaN keys, which the groupby drops along with the nulls
+    categories = group_keys.cat.categories
+    group_keys = group_keys.cat.remove_categories(categories[categories.astype(str).str.strip() == ''])
+    mrr_grouped = mrr_values.groupby(group_keys, observed=True).sum()
     
     # Use first 12 months or available months
     available_months = min(12, len(monthly_cols))
     monthly_cols = monthly_cols[:available_months]
     
-    # Create quarterly aggregation
-    quarters_mapping = {
-        'Q1 2024': monthly_cols[:3],                    # Jan, Feb, Mar
-        'Q2 2024': monthly_cols[3:6] if len(monthly_cols) >= 6 else [],    # Apr, May, Jun
-        'Q3 2024': monthly_cols[6:9] if len(monthly_cols) >= 9 else [],    # Jul, Aug, Sep
-        'Q4 2024': monthly_cols[9:12] if len(monthly_cols) >= 12 else []   # Oct, Nov, Dec
-    }
+    # Create quarterly aggregation: lay the months out as a (groups, 12) matrix
+    # so every quarter is summed in a single pass
+    monthly_values = np.zeros((len(mrr_grouped), 12))
+    monthly_values[:, :available_months] = mrr_grouped[monthly_cols].to_numpy(dtype=float)
     
-    # Calculate quarterly MRR
-    quarterly_mrr = pd.DataFrame(index=mrr_grouped.index)
-    for quarter, months in quarters_mapping.items():
-        if months:  # Only process if months exist
-            quarterly_mrr[quarter] = mrr_grouped[months].sum(axis=1)
-        else:
-            quarterly_mrr[quarter] = 0
+    # Q2-Q4 only count once all three of their months are present (Q1 may be partial)
+    monthly_values[:, max(3, available_months // 3 * 3):] = 0
+    quarterly_values = sum_quarters(monthly_values)
     
     # Debug: Show quarterly totals
     #quarterly_totals = quarterly_mrr.sum()
@@ -136,56 +295,48 @@ def load_and_process_data(file_path, analysis_type):
     #for quarter, total in quarterly_totals.items():
      #   st.write(f"- {quarter}: ${total:,.2f}")
     
-    # Calculate quarterly percentages
-    quarterly_percentages = pd.DataFrame(index=quarterly_mrr.index)
-    for quarter in quarterly_mrr.columns:
-        total = quarterly_mrr[quarter].sum()
-        if total > 0:
-            quarterly_percentages[quarter] = (quarterly_mrr[quarter] / total) * 100
-        else:
-            quarterly_percentages[quarter] = 0
+    # Calculate quarterly percentages in one broadcast against the column totals
+    quarterly_totals = quarterly_values.sum(axis=0)
+    percentage_values = np.divide(quarterly_values * 100, quarterly_totals,
+                                  out=np.zeros_like(quarterly_values), where=quarterly_totals > 0)
     
     # Round to 2 decimal places
-    quarterly_mrr = quarterly_mrr.round(2)
-    quarterly_percentages = quarterly_percentages.round(2)
-
-    if analysis_type is None:
-        # For revenue bridge analysis, also return the raw df and customer info
-        customer_column = None
-        possible_customer_cols = ['Customer', 'Client', 'Customer Name', 'Client Name', 
-                                 'Company', 'Company Name', 'Entity', 'Account']
-        
-        for col in possible_customer_cols:
-            if col in df.columns:
-                customer_column = col
-                break
-        
-        if customer_column is None:
-            for col in df.columns:
-                if df[col].dtype == 'object' and col not in ['Country', 'Industry']:
-                    customer_column = col
-                    break
-        
-        return df, customer_column, monthly_cols
-        
-    return quarterly_mrr, quarterly_percentages, mrr_grouped
+    quarterly_mrr = pd.DataFrame(np.round(quarterly_values, 2), index=mrr_grouped.index, columns=QUARTERS)
+    quarterly_percentages = pd.DataFrame(np.round(percentage_values, 2), index=mrr_grouped.index, columns=QUARTERS)
+
+    # Only the month totals feed the MoM view, so the per-group monthly table is not cached
+    monthly_totals = mrr_grouped.sum()
+    
+    return quarterly_mrr, quarterly_percentages, monthly_totals
 
 
-def create_percentage_pie_chart(quarterly_percentages, quarter, analysis_type):
+@st.cache_resource
+def create_percentage_pie_chart(quarterly_percentages, quarter, analysis_type, max_slices=12):
     """Create a pie chart for MRR percentage distribution for a single quarter"""
     
+    import plotly.express as px
+    
     # Get data for the selected quarter
     quarter_data = quarterly_percentages[quarter]
     
     # Filter out zero values for cleaner pie chart
     quarter_data = quarter_data[quarter_data > 0]
     
+    # Keep the largest slices and fold the long tail into a single "Other" slice
+    top_data = quarter_data.nlargest(max_slices)
+    other_share = quarter_data.sum() - top_data.sum()
+    names = top_data.index.astype(str).tolist()
+    values = top_data.values.tolist()
+    if len(quarter_data) > max_slices and other_share > 0:
+        names.append("Other")
+        values.append(round(other_share, 2))
+    
     # Choose color scheme based on analysis type
     color_scheme = px.colors.qualitative.Set3 if analysis_type == "Geography" else px.colors.qualitative.Set2
     
     fig = px.pie(
-        values=quarter_data.values,
-        names=quarter_data.index,
+        values=values,
+        names=names,
         title=f"MRR Percentage Distribution by {analysis_type} - {quarter}",
         color_discrete_sequence=color_scheme
     )
@@ -206,20 +357,36 @@ def create_percentage_pie_chart(quarterly_percentages, quarter, analysis_type):
     return fig
 
 
+@st.cache_resource
+def create_all_pie_charts(quarterly_percentages, analysis_type):
+    """Build the pie chart for every quarter once, frozen as plain figure dicts"""
+    
+    # Switching quarters then only looks up a ready figure instead of re-running px.pie
+    return {
+        quarter: create_percentage_pie_chart(quarterly_percentages, quarter, analysis_type).to_dict()
+        for quarter in quarterly_percentages.columns
+    }
+
+
+@st.cache_resource
 def create_trend_chart(quarterly_mrr, analysis_type):
     """Create a line chart showing MRR trends by selected dimension"""
     
-    fig = go.Figure()
+    import plotly.express as px
     
-    for dimension in quarterly_mrr.index:
-        fig.add_trace(go.Scatter(
-            x=quarterly_mrr.columns,
-            y=quarterly_mrr.loc[dimension],
-            mode='lines+markers',
-            name=dimension,
-            line=dict(width=3),
-            marker=dict(size=8)
-        ))
+    # Reshape to long format so plotly builds every line in one vectorized pass
+    trend_df = quarterly_mrr.rename_axis(index=analysis_type, columns='Quarter').stack().rename('MRR').reset_index()
+    
+    fig = px.line(
+        trend_df,
+        x='Quarter',
+        y='MRR',
+        color=analysis_type,
+        markers=True,
+        render_mode='webgl'
+    )
+    
+    fig.update_traces(line=dict(width=3), marker=dict(size=8))
     
     fig.update_layout(
         title=f"MRR Trend Analysis by {analysis_type}",
@@ -231,28 +398,53 @@ def create_trend_chart(quarterly_mrr, analysis_type):
     
     return fig
 
-def calculate_monthly_data_simple(monthly_mrr):
-    """Calculate monthly MRR totals and MOM growth rates - simplified version"""
+
+def period_over_period_growth(mrr_values):
+    """Percentage growth of each period over the previous one, along the last axis"""
+    
+    # The first period has no previous one and a zero previous period has no defined growth (NaN)
+    mrr_values = np.asarray(mrr_values, dtype=float)
+    previous, current = mrr_values[..., :-1], mrr_values[..., 1:]
+    return np.divide(current - previous, previous, out=np.full_like(current, np.nan), where=previous != 0) * 100
+
+
+@st.cache_data
+def calculate_quarterly_growth(quarterly_mrr):
+    """Calculate quarter-over-quarter growth rates for each dimension"""
     
-    # Get monthly totals across all dimensions
-    monthly_totals = monthly_mrr.sum()
+    growth = period_over_period_growth(quarterly_mrr.to_numpy())
     
-    # Calculate MOM growth rates
-    mom_growth = monthly_totals.pct_change() * 100
+    return pd.DataFrame(np.round(growth, 2), index=quarterly_mrr.index, columns=quarterly_mrr.columns[1:])
+
+
+def calculate_monthly_data_simple(monthly_totals):
+    """Calculate MOM growth rates from monthly MRR totals - simplified version"""
+    
+    # Calculate MOM growth rates on the raw array with the same rule as the quarterly
+    # growth; the first month has no previous month and stays NaN
+    total_values = monthly_totals.to_numpy(dtype=float)
+    mom_growth = np.concatenate(([np.nan], period_over_period_growth(total_values)))
+    
+    # Label the months in one vectorized parse; unparseable headers keep their first 10 characters
+    month_names = monthly_totals.index.astype(str)
+    month_dates = pd.to_datetime(month_names, errors='coerce', format='mixed')
+    month_labels = np.where(month_dates.notna(), month_dates.strftime('%b %Y'), month_names.str[:10])
     
     # Create a simple monthly dataframe
     monthly_df = pd.DataFrame({
-        'Month': [pd.to_datetime(str(col)).strftime('%b %Y') if pd.to_datetime(str(col), errors='coerce') is not pd.NaT else str(col)[:10] for col in monthly_totals.index],
-        'Total_MRR': monthly_totals.values,
-        'MOM_Growth_Pct': mom_growth.values
+        'Month': month_labels,
+        'Total_MRR': total_values,
+        'MOM_Growth_Pct': mom_growth
     })
     
     return monthly_df
 
 
+@st.cache_resource
 def create_simple_mom_chart(monthly_df):
     """Create a simple combination chart for monthly MRR and MOM growth"""
     
+    import plotly.graph_objects as go
     from plotly.subplots import make_subplots
     
     fig = make_subplots(specs=[[{"secondary_y": True}]])
@@ -291,90 +483,60 @@ def create_simple_mom_chart(monthly_df):
     
     return fig
 
-def analyze_individual_customers_q1(df, top_n_list=[5, 10, 15]):
+
+@st.cache_data
+def analyze_individual_customers_q1(df, customer_column, monthly_cols, top_n_list=[5, 10, 15]):
     """Analyze individual customers by Q1 2024 revenue"""
     
-    # Find customer/client column - look for common customer identifier columns
-    customer_column = None
-    possible_customer_cols = ['Customer', 'Client', 'Customer Name', 'Client Name', 
-                             'Company', 'Company Name', 'Entity', 'Account', 
-                             'Customer_Name', 'Client_Name']
-    
-    for col in possible_customer_cols:
-        if col in df.columns:
-            customer_column = col
-            break
-    
-    if customer_column is None:
-        # If no standard customer column found, use the first non-numeric column
-        for col in df.columns:
-            if df[col].dtype == 'object' and col not in ['Country', 'Industry', 'Geography']:
-                customer_column = col
-                break
-    
+    # The customer column and the month-ordered 2024 columns are detected once per upload by the caller
     if customer_column is None:
         raise ValueError("No customer identifier column found in the dataset")
     
-    # Get monthly columns for 2024
-    monthly_cols = []
-    for col in df.columns:
-        if isinstance(col, pd.Timestamp) and col.year == 2024:
-            monthly_cols.append(col)
-        elif isinstance(col, str) and '2024' in str(col):
-            try:
-                parsed_date = pd.to_datetime(col, errors='coerce')
-                if pd.notna(parsed_date) and parsed_date.year == 2024:
-                    monthly_cols.append(col)
-            except:
-                continue
-    
-    if not monthly_cols:
-        # Last resort - look for any column containing "2024"
-        for col in df.columns:
-            if '2024' in str(col):
-                monthly_cols.append(col)
-    
-    # Sort monthly columns chronologically
-    if monthly_cols:
-        try:
-            monthly_cols = sorted(monthly_cols, key=lambda x: pd.to_datetime(str(x)))
-        except:
-            monthly_cols = sorted(monthly_cols)
-    
     # Get Q1 columns (first 3 months)
     q1_cols = monthly_cols[:3]
     
     if len(q1_cols) == 0:
         raise ValueError("No Q1 monthly columns found")
     
-    # Create customer revenue dataframe
-    customer_df = df[[customer_column] + q1_cols].copy()
+    # Convert the Q1 columns to numeric in one pass
+    customer_df = df[q1_cols].apply(pd.to_numeric, errors='coerce').fillna(0).astype(np.float64)
     
-    # Convert monthly columns to numeric
-    for col in q1_cols:
-        customer_df[col] = pd.to_numeric(customer_df[col], errors='coerce').fillna(0)
+    # Remove rows with null or empty customer names; trimming and measuring the names
+    # on an Arrow buffer is one pass, and nulls come out as invalid
+    customer_names = pa.array(df[customer_column].astype('string[pyarrow]').array)
+    trimmed_lengths = pc.utf8_length(pc.utf8_trim_whitespace(customer_names))
+    valid_rows = pc.fill_null(pc.greater(trimmed_lengths, 0), False).to_numpy(zero_copy_only=False)
+    customer_df = customer_df[valid_rows]
     
-    # Remove rows with null or empty customer names
-    customer_df = customer_df.dropna(subset=[customer_column])
-    customer_df = customer_df[customer_df[customer_column].astype(str).str.strip() != '']
-    
-    # Group by customer (in case there are duplicate customer entries)
-    customer_grouped = customer_df.groupby(customer_column).sum()
+    # Group by customer (in case there are duplicate customer entries); categorical keys
+    # let the groupby hash integer codes instead of Python strings
+    customer_keys = df[customer_column][valid_rows].astype('category')
+    customer_grouped = customer_df.groupby(customer_keys, observed=True).sum()
     
     # Calculate Q1 total revenue for each customer
     customer_grouped['Q1_Total'] = customer_grouped[q1_cols].sum(axis=1)
     
-    # Sort customers by Q1 revenue in descending order
-    customer_q1_sorted = customer_grouped['Q1_Total'].sort_values(ascending=False)
+    # Q1 revenue for every customer, in customer order
+    customer_q1_totals = customer_grouped['Q1_Total']
+    total_q1_revenue = customer_q1_totals.sum()
+    
+    # Only the largest top N need ranking: select them in linear time, then sort just those
+    q1_values = customer_q1_totals.to_numpy()
+    k = min(max(top_n_list), q1_values.size)
+    if k == q1_values.size:
+        top_positions = np.argsort(-q1_values, kind='stable')
+    else:
+        top_positions = np.argpartition(-q1_values, k)[:k]
+        top_positions = top_positions[np.argsort(-q1_values[top_positions], kind='stable')]
+    customer_q1_top = customer_q1_totals.iloc[top_positions]
     
     # Create analysis for different top N values
     top_customers_analysis = {}
     
     for n in top_n_list:
-        top_n_customers = customer_q1_sorted.head(n)
+        top_n_customers = customer_q1_top.head(n)
         
         # Calculate percentage of total revenue
-        total_q1_revenue = customer_q1_sorted.sum()
         top_n_percentage = (top_n_customers.sum() / total_q1_revenue) * 100 if total_q1_revenue > 0 else 0
         
         top_customers_analysis[n] = {
@@ -385,12 +547,15 @@ def analyze_individual_customers_q1(df, top_n_list=[5, 10, 15]):
             'customer_details': customer_grouped.loc[top_n_customers.index]
         }
     
-    return top_customers_analysis, customer_q1_sorted, customer_column
+    return top_customers_analysis, customer_q1_totals, customer_column
 
 
+@st.cache_resource
 def create_individual_customers_chart(top_customers_data, top_n):
     """Create a horizontal bar chart for top N individual customers"""
     
+    import plotly.express as px
+    
     customers = top_customers_data[top_n]['customers']
     
     fig = px.bar(
@@ -419,9 +584,12 @@ def create_individual_customers_chart(top_customers_data, top_n):
     return fig
 
 
+@st.cache_resource
 def create_customer_monthly_breakdown_chart(customer_details, top_n, q1_cols):
     """Create a stacked bar chart showing monthly breakdown for top customers"""
     
+    import plotly.express as px
+    
     # Get top N customers monthly data
     top_customers_monthly = customer_details.head(top_n)[q1_cols]
     
@@ -445,9 +613,12 @@ def create_customer_monthly_breakdown_chart(customer_details, top_n, q1_cols):
     return fig
 
 
+@st.cache_resource
 def create_customer_concentration_chart(top_customers_analysis):
     """Create a chart showing revenue concentration across different top N groups"""
     
+    import plotly.express as px
+    
     top_n_values = list(top_customers_analysis.keys())
     percentages = [top_customers_analysis[n]['percentage_of_total'] for n in top_n_values]
     
@@ -473,6 +644,21 @@ def create_customer_concentration_chart(top_customers_analysis):
     )
     
     return fig
+
+
+def select_top_changes(changes, k, largest=True):
+    """Return the k largest (or smallest) revenue changes, sorted, without sorting every customer"""
+    
+    # argpartition isolates the k extremes in linear time; only those k get sorted
+    if len(changes) > k:
+        change_values = changes.to_numpy()
+        positions = np.argpartition(-change_values if largest else change_values, k - 1)[:k]
+        changes = changes.iloc[positions]
+    
+    return changes.sort_values(ascending=not largest, kind='stable')
+
+
+@st.cache_data
 def calculate_revenue_bridge(df, customer_column, monthly_cols):
     """Calculate revenue bridge components between Q1 and Q2"""
     
@@ -480,48 +666,58 @@ def calculate_revenue_bridge(df, customer_column, monthly_cols):
     q1_cols = monthly_cols[:3]   # First 3 months
     q2_cols = monthly_cols[3:6]  # Next 3 months
     
-    # Create customer revenue dataframes
-    customer_df = df[[customer_column] + q1_cols + q2_cols].copy()
-    
-    # Convert to numeric
-    for col in q1_cols + q2_cols:
-        customer_df[col] = pd.to_numeric(customer_df[col], errors='coerce').fillna(0)
-    
-    # Remove rows with null customer names
-    customer_df = customer_df.dropna(subset=[customer_column])
-    customer_df = customer_df[customer_df[customer_column].astype(str).str.strip() != '']
-    
-    # Group by customer and sum quarterly revenue
-    customer_grouped = customer_df.groupby(customer_column).sum()
-    
-    # Calculate Q1 and Q2 totals per customer
-    customer_grouped['Q1_Total'] = customer_grouped[q1_cols].sum(axis=1)
-    customer_grouped['Q2_Total'] = customer_grouped[q2_cols].sum(axis=1)
-    
-    # Calculate overall Q1 and Q2 revenue
-    opening_revenue = customer_grouped['Q1_Total'].sum()
-    #opening_revenue =  11984265
-    closing_revenue = customer_grouped['Q2_Total'].sum()
-    #closing_revenue =  13511929
+    # Convert the six months to numeric as one 2-D block rather than column by column
+    quarter_cols = q1_cols + q2_cols
+    customer_df = df[quarter_cols].apply(pd.to_numeric, errors='coerce').fillna(0).astype(np.float64)
+    # Arrow-backed strings keep the blank check, hashing and uniqueness test in C++
+    customer_names = df[customer_column].astype('string[pyarrow]')
+    
+    # Remove rows with null or blank customer names; trimming and measuring the names
+    # on the Arrow buffer is one pass, and nulls come out as invalid
+    trimmed_lengths = pc.utf8_length(pc.utf8_trim_whitespace(pa.array(customer_names.array)))
+    valid_rows = pc.fill_null(pc.greater(trimmed_lengths, 0), False).to_numpy(zero_copy_only=False)
+    customer_df = customer_df[valid_rows]
+    customer_names = customer_names[valid_rows]
+    
+    # Group by customer and sum quarterly revenue; when every row is already a distinct
+    # customer there is nothing to aggregate, so only the name order is applied.
+    # Otherwise categorical keys let the groupby hash integer codes
+    if customer_names.is_unique:
+        customer_grouped = customer_df.set_index(customer_names).sort_index()
+    else:
+        customer_grouped = customer_df.groupby(customer_names.astype('category'), observed=True).sum()
+    
+    # Calculate Q1 and Q2 totals per customer in a single pass over the six months
+    quarter_totals = np.add.reduceat(customer_grouped[quarter_cols].to_numpy(), [0, len(q1_cols)], axis=1)
+    customer_grouped['Q1_Total'] = quarter_totals[:, 0]
+    customer_grouped['Q2_Total'] = quarter_totals[:, 1]
     
     # Calculate bridge components
     q1_revenue = customer_grouped['Q1_Total']
     q2_revenue = customer_grouped['Q2_Total']
+    q1_values = q1_revenue.to_numpy()
+    q2_values = q2_revenue.to_numpy()
     
-    # Churn: Customers with revenue in Q1 but zero in Q2
-    churned_customers = q1_revenue[(q1_revenue > 0) & (q2_revenue == 0)]
-    churn = -churned_customers.sum()  # Negative value (lost revenue)
+    # Calculate overall Q1 and Q2 revenue
+    opening_revenue = float(q1_values.sum())
+    #opening_revenue =  11984265
+    closing_revenue = float(q2_values.sum())
+    #closing_revenue =  13511929
     
-    # New customers: Customers with zero revenue in Q1 but revenue in Q2
-    new_customers_data = q2_revenue[(q1_revenue == 0) & (q2_revenue > 0)]
-    new_customers = new_customers_data.sum()
+    # Segment every customer and total the components in one pass; the top-5
+    # masks and segment labels below reuse the codes
+    segment_codes, component_sums, component_counts = summarize_bridge(q1_values, q2_values)
+    churn, new_customers, expansion, contraction = (float(total) for total in component_sums)
+    expansion_mask = segment_codes == 2
+    contraction_mask = segment_codes == 3
     
-    # Expansion: Existing customers with increased revenue
+    # Per-customer change; churned and new customers are read from the Segment
+    # column on demand rather than copied into their own Series
     expansion_data = q2_revenue - q1_revenue
-    expansion = expansion_data[(expansion_data > 0) & (q1_revenue > 0)].sum()
     
-    # Contraction: Existing customers with decreased revenue (but not churned)
-    contraction = expansion_data[(expansion_data < 0) & (q2_revenue > 0)].sum()
+    # Percentage change in one guarded divide; customers without Q1 revenue show 0
+    change_values = expansion_data.to_numpy()
+    change_pct = np.divide(change_values * 100, q1_values, out=np.zeros_like(change_values), where=q1_values != 0)
     
     # Calculate NRR and GRR - CORRECTED FORMULAS
     nrr = (opening_revenue + churn + expansion + contraction) / opening_revenue if opening_revenue != 0 else 0
@@ -530,26 +726,15 @@ def calculate_revenue_bridge(df, customer_column, monthly_cols):
     # Prepare detailed customer breakdown - ENSURE THIS IS PROPERLY DEFINED
     customer_analysis = pd.DataFrame({
         'Customer': customer_grouped.index,
-        'Q1_Revenue': customer_grouped['Q1_Total'],
-        'Q2_Revenue': customer_grouped['Q2_Total'],
-        'Change': customer_grouped['Q2_Total'] - customer_grouped['Q1_Total'],
-        'Change_Pct': ((customer_grouped['Q2_Total'] - customer_grouped['Q1_Total']) / customer_grouped['Q1_Total'] * 100).replace([np.inf, -np.inf], np.nan).fillna(0)
+        'Q1_Revenue': q1_revenue,
+        'Q2_Revenue': q2_revenue,
+        'Change': expansion_data,
+        'Change_Pct': change_pct
     })
     
-    # Add customer segments
-    def categorize_customer(row):
-        if row['Q1_Revenue'] > 0 and row['Q2_Revenue'] == 0:
-            return 'Churned'
-        elif row['Q1_Revenue'] == 0 and row['Q2_Revenue'] > 0:
-            return 'New Customer'
-        elif row['Change'] > 0 and row['Q1_Revenue'] > 0:
-            return 'Expansion'
-        elif row['Change'] < 0 and row['Q2_Revenue'] > 0:
-            return 'Contraction'
-        else:
-            return 'Stable'
-    
-    customer_analysis['Segment'] = customer_analysis.apply(categorize_customer, axis=1)
+    # Add customer segments as a categorical over the codes, so the labels are
+    # only materialized for display and counting stays on the integer codes
+    customer_analysis['Segment'] = pd.Categorical.from_codes(segment_codes, BRIDGE_SEGMENTS)
     
     # Bridge data
     bridge_data = {
@@ -564,25 +749,26 @@ def calculate_revenue_bridge(df, customer_column, monthly_cols):
         'GRR': grr
     }
     
-    # Detailed metrics
+    # Detailed metrics; counts come straight from the kernel
     bridge_metrics = {
-        'churned_customers_count': len(churned_customers),
-        'new_customers_count': len(new_customers_data),
-        'expansion_customers_count': len(expansion_data[(expansion_data > 0) & (q1_revenue > 0)]),
-        'contraction_customers_count': len(expansion_data[(expansion_data < 0) & (q2_revenue > 0)]),
-        'churned_customers_list': churned_customers,
-        'new_customers_list': new_customers_data,
-        'top_expansion_customers': expansion_data[(expansion_data > 0) & (q1_revenue > 0)].nlargest(5),
-        'top_contraction_customers': expansion_data[(expansion_data < 0) & (q2_revenue > 0)].nsmallest(5)
+        'churned_customers_count': int(component_counts[0]),
+        'new_customers_count': int(component_counts[1]),
+        'expansion_customers_count': int(component_counts[2]),
+        'contraction_customers_count': int(component_counts[3]),
+        'top_expansion_customers': select_top_changes(expansion_data[expansion_mask], 5, largest=True),
+        'top_contraction_customers': select_top_changes(expansion_data[contraction_mask], 5, largest=False)
     }
     
     # ENSURE ALL THREE VARIABLES ARE RETURNED
     return bridge_data, customer_analysis, bridge_metrics
 
 
+@st.cache_resource
 def create_revenue_bridge_chart(bridge_data):
     """Create a waterfall-style revenue bridge chart"""
     
+    import plotly.graph_objects as go
+    
     categories = ['Q1 Revenue', 'Churn', 'Expansion', 'Contraction', 'New Customers', 'Q2 Revenue']
     values = [
         bridge_data['Opening_Revenue_Q1'],
@@ -593,43 +779,49 @@ def create_revenue_bridge_chart(bridge_data):
         bridge_data['Closing_Revenue_Q2']
     ]
     
-    # Create colors - green for positive, red for negative, blue for totals
-    colors = ['lightblue', 'red', 'green', 'orange', 'purple', 'lightblue']
-    
-    fig = go.Figure()
-    
-    # Add bars for each component
-    for i, (cat, val, color) in enumerate(zip(categories, values, colors)):
-        fig.add_trace(go.Bar(
-            x=[cat],
-            y=[val],
-            name=cat,
-            marker_color=color,
-            text=f'${val:,.0f}',
-            textposition='outside' if val >= 0 else 'inside',
+    # A native waterfall trace floats each component on the running total; the closing
+    # bar is absolute so it shows the actual Q2 revenue, which also covers customers
+    # whose change falls outside the four components
+    fig = go.Figure(
+        go.Waterfall(
+            x=categories,
+            y=values,
+            measure=['absolute', 'relative', 'relative', 'relative', 'relative', 'absolute'],
+            text=[f'${val:,.0f}' for val in values],
+            textposition='outside',
+            increasing=dict(marker_color='green'),
+            decreasing=dict(marker_color='red'),
+            totals=dict(marker_color='lightblue'),
+            connector=dict(line=dict(color='rgb(63, 63, 63)')),
             showlegend=False
-        ))
-    
-    fig.update_layout(
-        title='Revenue Bridge: Q1 to Q2 2024',
-        xaxis_title='Components',
-        yaxis_title='Revenue (USD)',
-        height=500,
-        font=dict(size=12),
-        yaxis=dict(tickformat='$,.0f')
+        ),
+        layout=dict(
+            title='Revenue Bridge: Q1 to Q2 2024',
+            xaxis_title='Components',
+            yaxis_title='Revenue (USD)',
+            height=500,
+            font=dict(size=12),
+            yaxis=dict(tickformat='$,.0f')
+        )
     )
     
     return fig
 
 
+@st.cache_resource
 def create_customer_segment_chart(customer_analysis):
     """Create a pie chart showing customer segmentation"""
     
-    segment_counts = customer_analysis['Segment'].value_counts()
+    import plotly.express as px
+    
+    # Count segments straight from the integer codes, largest first, skipping empty segments
+    segment_counts = np.bincount(customer_analysis['Segment'].cat.codes, minlength=len(BRIDGE_SEGMENTS))
+    segment_order = np.argsort(-segment_counts, kind='stable')
+    segment_order = segment_order[segment_counts[segment_order] > 0]
     
     fig = px.pie(
-        values=segment_counts.values,
-        names=segment_counts.index,
+        values=segment_counts[segment_order],
+        names=BRIDGE_SEGMENTS[segment_order],
         title='Customer Segmentation: Q1 to Q2 Movement',
         color_discrete_sequence=px.colors.qualitative.Set2
     )
@@ -648,9 +840,13 @@ def create_customer_segment_chart(customer_analysis):
     return fig
 
 
+@st.cache_resource
 def create_nrr_grr_gauge_chart(nrr, grr):
     """Create gauge charts for NRR and GRR"""
     
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
     fig = make_subplots(
         rows=1, cols=2,
         specs=[[{'type': 'indicator'}, {'type': 'indicator'}]],